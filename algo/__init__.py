@@ -1,5 +1,7 @@
 from .algo import Algo
+from .evaluator import Evaluator
 
 __all__ = [
     "Algo",
+    "Evaluator",
 ]
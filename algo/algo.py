@@ -1,18 +1,29 @@
 from time import time
+from typing import List
 
-from board import Board
+from board import Board, State
+from .evaluator import Evaluator
 from .node import MctsNode
 
 class Algo:
-    def __init__(self):
+    def __init__(self, evaluator: Evaluator=None, batch_size: int=1):
+        """Instantiates a new search.
+        If `evaluator` is given, leaves are scored by the evaluator instead of random playouts,
+        `batch_size` leaves at a time.
+        """
         self.root: MctsNode = None
+        self.evaluator: Evaluator = evaluator
+        self.batch_size: int = batch_size
     
     def next_move(self, board: Board, time_control: float) -> int:
         self.root = MctsNode(board)
         start_time = time()
         end_time = start_time + time_control
         while time() < end_time:
-            self._search()
+            if self.evaluator is None:
+                self._search()
+            else:
+                self._search_with_evaluator()
         return self.root.best_move()
     
     def _search(self) -> None:
@@ -20,3 +31,22 @@ class Algo:
         child = leaf.expand()
         value = child.simulate()
         child.back_propagates(value)
+    
+    def _search_with_evaluator(self) -> None:
+        leaves: List[MctsNode] = []
+        for _ in range(self.batch_size):
+            leaf = self.root.select()
+            if leaf.board.winner != State.UNDETERMINED:
+                leaf.back_propagates(leaf.terminal_value())
+                continue
+            if leaf in leaves:
+                break
+            leaf.add_virtual_loss(1)
+            leaves.append(leaf)
+
+        if len(leaves) == 0:
+            return
+        values = MctsNode.evaluate_batch(leaves, self.evaluator)
+        for leaf, value in zip(leaves, values):
+            leaf.add_virtual_loss(-1)
+            leaf.back_propagates(value)
@@ -0,0 +1,96 @@
+from typing import Dict, List, Tuple
+import base64
+
+import numpy as np
+
+from board import Board
+from config import height, width
+from .weights import WEIGHTS
+
+class Evaluator:
+    """Small MLP scoring a position for the player to move.
+    The value head estimates the outcome in [-1, 1],
+    and the policy head gives a prior over the columns.
+    """
+    SHIFTS = np.arange(height * width, dtype=np.uint64)
+    
+    PARAMS = ["W1", "b1", "Wv", "bv", "Wp", "bp"]
+    
+    def __init__(self, params: Dict[str, np.ndarray]):
+        """Instantiates an evaluator from a dictionary of weight arrays.
+        """
+        self.W1 = np.asarray(params["W1"], dtype=np.float32)
+        self.b1 = np.asarray(params["b1"], dtype=np.float32)
+        self.Wv = np.asarray(params["Wv"], dtype=np.float32)
+        self.bv = np.float32(params["bv"])
+        self.Wp = np.asarray(params["Wp"], dtype=np.float32)
+        self.bp = np.asarray(params["bp"], dtype=np.float32)
+    
+    def decode(weights: Dict[str, object]) -> Dict[str, np.ndarray]:
+        """Returns the weight arrays of a dictionary produced by `train.model.Model.to_weights`,
+        where each array is stored as its shape and its base64-encoded float16 bytes.
+        """
+        params: Dict[str, np.ndarray] = {}
+        for key in Evaluator.PARAMS:
+            shape, data = weights[key]
+            params[key] = np.frombuffer(base64.b64decode(data), dtype=np.float16).reshape(shape)
+        return params
+    
+    def load() -> "Evaluator":
+        """Returns the evaluator embedded in `algo/weights.py`,
+        or `None` if there is none trained for the configured board size.
+        """
+        if WEIGHTS is None or WEIGHTS["height"] != height or WEIGHTS["width"] != width:
+            return None
+        return Evaluator(Evaluator.decode(WEIGHTS))
+    
+    def features(own: np.ndarray, opp: np.ndarray) -> np.ndarray:
+        """Returns the feature matrix of a batch of positions.
+        `own` and `opp` are arrays of bitboards of the player to move and of the opponent.
+        """
+        own_bits = (own[:, None] >> Evaluator.SHIFTS) & np.uint64(1)
+        opp_bits = (opp[:, None] >> Evaluator.SHIFTS) & np.uint64(1)
+        return np.concatenate((own_bits, opp_bits), axis=1).astype(np.float32)
+    
+    def bitboards(boards: List[Board]) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the bitboards of the player to move and of the opponent.
+        """
+        own = [board.X_table if board.is_X_turn else board.O_table for board in boards]
+        opp = [board.O_table if board.is_X_turn else board.X_table for board in boards]
+        return np.array(own, dtype=np.uint64), np.array(opp, dtype=np.uint64)
+    
+    def forward(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the values and the policy logits of a feature matrix.
+        """
+        hidden = np.maximum(features @ self.W1 + self.b1, 0)
+        values = np.tanh(hidden @ self.Wv + self.bv)
+        logits = hidden @ self.Wp + self.bp
+        return values, logits
+    
+    def evaluate_batch(self, boards: List[Board]) -> List[Tuple[float, Dict[int, float]]]:
+        """Scores a batch of non-terminal boards.
+        Returns, for each board, its value for the player to move
+        and the prior of each of its actions.
+        """
+        own, opp = Evaluator.bitboards(boards)
+        values, logits = self.forward(Evaluator.features(own, opp))
+        results: List[Tuple[float, Dict[int, float]]] = []
+        for board, value, logit in zip(boards, values.tolist(), logits):
+            actions = board.actions()
+            columns = [action for action in actions if action != -1]
+            exp = np.exp(logit[columns] - logit[columns].max())
+            probs = exp / exp.sum()
+            if len(columns) < len(actions):
+                # The steal move is not in the policy head, give it an even share
+                share = 1 / len(actions)
+                priors = dict(zip(columns, (probs * (1 - share)).tolist()))
+                priors[-1] = share
+            else:
+                priors = dict(zip(columns, probs.tolist()))
+            results.append((value, priors))
+        return results
+    
+    def evaluate(self, board: Board) -> Tuple[float, Dict[int, float]]:
+        """Scores a single non-terminal board.
+        """
+        return self.evaluate_batch([board])[0]
@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from board import Board
+from config import height, width
+from .algo import Algo
+from .evaluator import Evaluator
+
+class EvaluatorTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        hidden = 16
+        self.evaluator = Evaluator({
+            "W1": rng.normal(0, 0.3, (2 * height * width, hidden)),
+            "b1": rng.normal(0, 0.1, hidden),
+            "Wv": rng.normal(0, 0.3, hidden),
+            "bv": 0,
+            "Wp": rng.normal(0, 0.3, (hidden, width)),
+            "bp": rng.normal(0, 0.1, width),
+        })
+
+    def test_features(self):
+        board = Board().move(3).move(3)
+        own, opp = Evaluator.bitboards([board])
+        features = Evaluator.features(own, opp)
+        self.assertEqual((1, 2 * height * width), features.shape)
+        # X to move, X owns the bottom of column 3, O the cell above
+        self.assertEqual(1, features[0, 3])
+        self.assertEqual(1, features[0, height * width + width + 3])
+        self.assertEqual(2, features.sum())
+
+        own, opp = Evaluator.bitboards([board.move(0)])
+        features = Evaluator.features(own, opp)
+        # O to move, so the perspective is swapped
+        self.assertEqual(1, features[0, width + 3])
+        self.assertEqual(1, features[0, height * width + 3])
+        self.assertEqual(1, features[0, height * width])
+
+    def test_batch_matches_single(self):
+        boards = [Board(), Board().move(2), Board().move(2).move(4)]
+        batch = self.evaluator.evaluate_batch(boards)
+        for board, (value, priors) in zip(boards, batch):
+            single_value, single_priors = self.evaluator.evaluate(board)
+            self.assertAlmostEqual(single_value, value, places=5)
+            for action in board.actions():
+                self.assertAlmostEqual(single_priors[action], priors[action], places=5)
+
+    def test_priors(self):
+        for board in [Board(), Board().move(2)]:
+            value, priors = self.evaluator.evaluate(board)
+            self.assertTrue(-1 <= value <= 1)
+            self.assertEqual(sorted(board.actions()), sorted(priors.keys()))
+            self.assertAlmostEqual(1, sum(priors.values()), places=5)
+
+    def test_search(self):
+        board = Board().move(2)
+        for batch_size in [1, 8]:
+            algo = Algo(self.evaluator, batch_size)
+            move = algo.next_move(board, 0.05)
+            self.assertIn(move, board.actions())
+            self.assertEqual(algo.root.N, sum(child.N for child in algo.root.children) + 1)
@@ -1,12 +1,14 @@
 from random import randint
 import math
-from typing import List
+from typing import Dict, List
 
 from board import Board, State
+from .evaluator import Evaluator
 
 class MctsNode:
     WIN = 1
     C = 1
+    C_PUCT = 1.5
 
     def __init__(self, board: Board, parent: "MctsNode"=None, move: int=None):
         self.N: int = 0
@@ -15,12 +17,19 @@ class MctsNode:
         self.parent: "MctsNode" = parent
         self.move: int = move
         self.children: List["MctsNode"] = None
+        self.P: float = None
     
     def _ucb(self) -> float:
+        if self.P is not None:
+            return self._puct()
         if self.N == 0:
             return float('inf')
         return -self.U / self.N + math.sqrt(math.log(self.parent.N) / self.N) * MctsNode.C
     
+    def _puct(self) -> float:
+        q = -self.U / self.N if self.N > 0 else 0
+        return q + MctsNode.C_PUCT * self.P * math.sqrt(self.parent.N) / (1 + self.N)
+    
     def select(self) -> "MctsNode":
         if self.children is None:
             return self
@@ -45,6 +54,31 @@ class MctsNode:
         index = randint(0, len(actions) - 1)
         return self.children[index]
     
+    def expand_with_priors(self, priors: Dict[int, float]) -> None:
+        assert self.children is None
+        self.children = []
+        for action in self.board.actions():
+            child = MctsNode(self.board.move(action), parent=self, move=action)
+            child.P = priors[action]
+            self.children.append(child)
+    
+    def terminal_value(self) -> float:
+        # The player who just moved is the one who can have won
+        if self.board.winner == State.DRAW:
+            return 0
+        return -MctsNode.WIN
+    
+    def evaluate_batch(nodes: List["MctsNode"], evaluator: Evaluator) -> List[float]:
+        """Scores non-terminal leaves with the evaluator in one batch,
+        expanding each leaf with the policy of the evaluator as priors.
+        """
+        results = evaluator.evaluate_batch([node.board for node in nodes])
+        values: List[float] = []
+        for node, (value, priors) in zip(nodes, results):
+            node.expand_with_priors(priors)
+            values.append(value * MctsNode.WIN)
+        return values
+    
     def simulate(self) -> float:
         board = self.board
         while board.winner == State.UNDETERMINED:
@@ -63,6 +97,16 @@ class MctsNode:
         if self.parent is not None:
             self.parent.back_propagates(-utility)
     
+    def add_virtual_loss(self, count: int) -> None:
+        # Makes a pending leaf look lost for the parent, so that a batch spreads over the tree
+        node = self
+        utility = MctsNode.WIN
+        while node is not None:
+            node.N += count
+            node.U += count * utility
+            utility = -utility
+            node = node.parent
+    
     def _best_child(self) -> "MctsNode":
         if self.children is None:
             return None
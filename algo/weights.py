@@ -0,0 +1,3 @@
+# Weights of the leaf evaluator, written by `python -m train.train`.
+# `None` means no evaluator has been trained, and the search falls back to random playouts.
+WEIGHTS = None
@@ -1,5 +1,6 @@
 from board import Board
-from algo import Algo
+from algo import Algo, Evaluator
+from config import use_evaluator, batch_size
 
 class Codingame:
     def run(self):
@@ -7,7 +8,7 @@ class Codingame:
         # opp_id: if your index is 0, this will be 1, and vice versa
         ids = input()
         board = Board()
-        algo = Algo()
+        algo = Algo(Evaluator.load() if use_evaluator else None, batch_size)
 
         # game loop
         while True:
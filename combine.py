@@ -1,3 +1,13 @@
+import sys
+
+from algo.weights import WEIGHTS
+from config import use_evaluator, batch_size
+
+# CodinGame rejects submissions longer than this
+MAX_LENGTH = 100000
+HEIGHT = 7
+WIDTH = 9
+
 def read_file(file_path: str) -> str:
     with open(file_path, "r") as file:
         lines = file.readlines()
@@ -9,13 +19,18 @@ def read_file(file_path: str) -> str:
 
 def get_config():
     return {
-        "initials": "from typing import Literal, List, Tuple\n" \
+        "initials": "from typing import Literal, Dict, List, Tuple\n" \
                     "from random import randint\n" \
                     "import math\n" \
                     "from time import time\n" \
-                    "height = 7\nwidth = 9\nsteal = True\nconnect = 4\n",
+                    "import base64\n" \
+                    "import numpy as np\n" \
+                    f"height = {HEIGHT}\nwidth = {WIDTH}\nsteal = True\nconnect = 4\n" \
+                    f"use_evaluator = {use_evaluator}\nbatch_size = {batch_size}\n",
         "files": [
             "board/board.py",
+            "algo/weights.py",
+            "algo/evaluator.py",
             "algo/node.py",
             "algo/algo.py",
             "codingame.py",
@@ -30,6 +45,13 @@ def combine():
     with open("combined.py", "w") as file:
         file.write(code)
 
+    if WEIGHTS is not None and (WEIGHTS["height"] != HEIGHT or WEIGHTS["width"] != WIDTH):
+        print(f"Warning: the weights in algo/weights.py are for a {WEIGHTS['height']}x{WEIGHTS['width']} board, "
+              f"not {HEIGHT}x{WIDTH}, so the combined bot will use random playouts", file=sys.stderr)
+    if len(code) > MAX_LENGTH:
+        print(f"Warning: combined.py has {len(code)} characters, "
+              f"more than the limit of {MAX_LENGTH}", file=sys.stderr)
+
 
 if __name__ == "__main__":
     combine()
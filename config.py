@@ -11,3 +11,7 @@ connect = 4
 # Play config
 turn = True # True to go first, False to go second
 time_control = 1 # Time control, in seconds
+
+# Evaluator config
+use_evaluator = True # True to score leaves with the weights in algo/weights.py instead of random playouts, if trained for this board size
+batch_size = 8 # Number of leaves scored together by the evaluator
@@ -1,10 +1,10 @@
-from algo import Algo
+from algo import Algo, Evaluator
 from board import Board, State
-from config import turn, width, time_control
+from config import turn, width, time_control, use_evaluator, batch_size
 
 def main():
     board = Board()
-    algo = Algo()
+    algo = Algo(Evaluator.load() if use_evaluator else None, batch_size)
     while board.winner == State.UNDETERMINED:
         print(board)
         if board.is_X_turn == turn:
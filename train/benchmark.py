@@ -0,0 +1,103 @@
+from argparse import ArgumentParser
+from random import randint, seed
+from time import time
+from typing import List
+
+from algo import Algo, Evaluator
+from algo.node import MctsNode
+from board import Board, State
+from config import batch_size
+
+def random_boards(count: int) -> List[Board]:
+    """Returns non-terminal boards reached by random play.
+    """
+    boards: List[Board] = []
+    while len(boards) < count:
+        board = Board()
+        for _ in range(randint(0, 20)):
+            actions = board.actions()
+            next_board = board.move(actions[randint(0, len(actions) - 1)])
+            if next_board.winner != State.UNDETERMINED:
+                break
+            board = next_board
+        boards.append(board)
+    return boards
+
+def evaluations_per_second(evaluator: Evaluator, boards: List[Board], batch_size: int) -> float:
+    start_time = time()
+    for start in range(0, len(boards), batch_size):
+        evaluator.evaluate_batch(boards[start:start + batch_size])
+    return len(boards) / (time() - start_time)
+
+def playouts_per_second(boards: List[Board]) -> float:
+    start_time = time()
+    for board in boards:
+        MctsNode(board).simulate()
+    return len(boards) / (time() - start_time)
+
+def iterations_per_second(algo: Algo, boards: List[Board], time_control: float) -> float:
+    """Returns the search iterations per second of `algo`, tree overhead included,
+    as the visits of the root over the time spent.
+    Visits of terminal leaves are counted too, so positions close to the end search faster.
+    """
+    visits = 0
+    for board in boards:
+        algo.next_move(board, time_control)
+        visits += algo.root.N
+    return visits / (len(boards) * time_control)
+
+def match(first: Algo, second: Algo, games: int, time_control: float) -> List[int]:
+    """Plays `games` games between two searches at equal time per move, alternating colours.
+    Returns the number of wins of `first`, draws, and wins of `second`.
+    """
+    results = [0, 0, 0]
+    for game in range(games):
+        players = (first, second) if game % 2 == 0 else (second, first)
+        board = Board()
+        # Open with a random move, so that games differ
+        board = board.move(randint(0, len(board.actions()) - 1))
+        while board.winner == State.UNDETERMINED:
+            algo = players[0] if board.is_X_turn else players[1]
+            board = board.move(algo.next_move(board, time_control))
+        if board.winner == State.DRAW:
+            results[1] += 1
+        elif (board.winner == State.X) == (game % 2 == 0):
+            results[0] += 1
+        else:
+            results[2] += 1
+    return results
+
+def main():
+    parser = ArgumentParser(description="Benchmark the leaf evaluator against random playouts.")
+    parser.add_argument("--positions", type=int, default=2000)
+    parser.add_argument("--search-positions", type=int, default=20)
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--time-control", type=float, default=0.1)
+    parser.add_argument("--batch-size", type=int, default=batch_size)
+    args = parser.parse_args()
+
+    seed(0)
+    evaluator = Evaluator.load()
+    if evaluator is None:
+        print("No trained weights for this board size in algo/weights.py, run train.train first")
+        return
+
+    boards = random_boards(args.positions)
+    print(f"Random playouts: {playouts_per_second(boards):.0f}/s")
+    for size in sorted({1, args.batch_size}):
+        print(f"Evaluations, batch of {size}: {evaluations_per_second(evaluator, boards, size):.0f}/s")
+
+    # The numbers above leave out the tree, so also time the whole search
+    search_boards = boards[:args.search_positions]
+    searches = [("Search with playouts", Algo())]
+    for size in sorted({1, args.batch_size}):
+        searches.append((f"Search with evaluator, batch of {size}", Algo(evaluator, size)))
+    for name, algo in searches:
+        print(f"{name}: {iterations_per_second(algo, search_boards, args.time_control):.0f} iterations/s")
+
+    wins, draws, losses = match(Algo(evaluator, args.batch_size), Algo(), args.games, args.time_control)
+    print(f"Evaluator vs playouts at {args.time_control}s per move: "
+          f"{wins} wins, {draws} draws, {losses} losses")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+from typing import Dict, Tuple
+import base64
+
+import numpy as np
+
+from config import height, width
+
+class Model:
+    """Trainable counterpart of `algo.Evaluator`, with the same layout of weights.
+    """
+    def __init__(self, hidden: int=64, rng: np.random.Generator=None):
+        rng = rng if rng is not None else np.random.default_rng(0)
+        inputs = 2 * height * width
+        self.params: Dict[str, np.ndarray] = {
+            "W1": rng.normal(0, np.sqrt(2 / inputs), (inputs, hidden)).astype(np.float32),
+            "b1": np.zeros(hidden, dtype=np.float32),
+            "Wv": rng.normal(0, np.sqrt(1 / hidden), hidden).astype(np.float32),
+            "bv": np.zeros((), dtype=np.float32),
+            "Wp": rng.normal(0, np.sqrt(1 / hidden), (hidden, width)).astype(np.float32),
+            "bp": np.zeros(width, dtype=np.float32),
+        }
+        self._m = {key: np.zeros_like(value) for key, value in self.params.items()}
+        self._v = {key: np.zeros_like(value) for key, value in self.params.items()}
+        self._step = 0
+
+    def loss_and_grads(self, features: np.ndarray, values: np.ndarray, policies: np.ndarray
+                       ) -> Tuple[float, float, Dict[str, np.ndarray]]:
+        """Returns the mean squared error of the value head,
+        the cross entropy of the policy head, and the gradients of their sum.
+        """
+        p = self.params
+        n = len(features)
+        pre = features @ p["W1"] + p["b1"]
+        hidden = np.maximum(pre, 0)
+        out = np.tanh(hidden @ p["Wv"] + p["bv"])
+        logits = hidden @ p["Wp"] + p["bp"]
+        logits -= logits.max(axis=1, keepdims=True)
+        log_probs = logits - np.log(np.exp(logits).sum(axis=1, keepdims=True))
+
+        value_loss = float(np.mean((out - values) ** 2))
+        policy_loss = float(-np.mean((policies * log_probs).sum(axis=1)))
+
+        d_out = 2 * (out - values) * (1 - out ** 2) / n
+        d_logits = (np.exp(log_probs) - policies) / n
+        d_hidden = np.outer(d_out, p["Wv"]) + d_logits @ p["Wp"].T
+        d_pre = d_hidden * (pre > 0)
+        grads = {
+            "W1": features.T @ d_pre,
+            "b1": d_pre.sum(axis=0),
+            "Wv": hidden.T @ d_out,
+            "bv": d_out.sum(),
+            "Wp": hidden.T @ d_logits,
+            "bp": d_logits.sum(axis=0),
+        }
+        return value_loss, policy_loss, grads
+
+    def adam_step(self, grads: Dict[str, np.ndarray], lr: float, weight_decay: float,
+                  beta1: float=0.9, beta2: float=0.999, eps: float=1e-8) -> None:
+        self._step += 1
+        for key, grad in grads.items():
+            if key in ("W1", "Wv", "Wp"):
+                grad = grad + weight_decay * self.params[key]
+            self._m[key] = beta1 * self._m[key] + (1 - beta1) * grad
+            self._v[key] = beta2 * self._v[key] + (1 - beta2) * grad ** 2
+            m_hat = self._m[key] / (1 - beta1 ** self._step)
+            v_hat = self._v[key] / (1 - beta2 ** self._step)
+            self.params[key] = (self.params[key] - lr * m_hat / (np.sqrt(v_hat) + eps)).astype(np.float32)
+
+    def to_weights(self) -> Dict[str, object]:
+        """Returns the weights as plain python values, as read by `algo.Evaluator.decode`.
+        Each array is stored as its shape and its base64-encoded float16 bytes,
+        to keep the weights small enough to embed in `combined.py`.
+        """
+        weights: Dict[str, object] = {"height": height, "width": width}
+        for key, value in self.params.items():
+            data = base64.b64encode(value.astype(np.float16).tobytes()).decode("ascii")
+            weights[key] = (list(value.shape), data)
+        return weights
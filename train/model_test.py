@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+
+from algo import Evaluator
+from config import height, width
+from .model import Model
+
+class ModelTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.model = Model(hidden=5, rng=rng)
+        self.model.params = {key: value.astype(np.float64) for key, value in self.model.params.items()}
+        self.model.params["bv"] = np.array(0.1)
+        self.features = rng.integers(0, 2, (6, 2 * height * width)).astype(np.float64)
+        self.values = np.array([1, -1, 0, 1, -1, 1], dtype=np.float64)
+        policies = rng.random((6, width))
+        self.policies = policies / policies.sum(axis=1, keepdims=True)
+
+    def _loss(self) -> float:
+        value_loss, policy_loss, _ = self.model.loss_and_grads(self.features, self.values, self.policies)
+        return value_loss + policy_loss
+
+    def test_gradients(self):
+        _, _, grads = self.model.loss_and_grads(self.features, self.values, self.policies)
+        rng = np.random.default_rng(3)
+        eps = 1e-6
+        for key, param in self.model.params.items():
+            for _ in range(5):
+                index = tuple(rng.integers(0, size) for size in param.shape)
+                original = param[index]
+                param[index] = original + eps
+                plus = self._loss()
+                param[index] = original - eps
+                minus = self._loss()
+                param[index] = original
+                numerical = (plus - minus) / (2 * eps)
+                self.assertAlmostEqual(numerical, grads[key][index], places=5, msg=f"{key}{index}")
+
+    def test_weights_round_trip(self):
+        params = Evaluator.decode(self.model.to_weights())
+        for key, value in self.model.params.items():
+            self.assertEqual(value.shape, params[key].shape)
+            np.testing.assert_allclose(value, params[key], atol=1e-3)
@@ -0,0 +1,89 @@
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from random import Random, seed
+from typing import List, Tuple
+
+import numpy as np
+
+from algo import Algo
+from board import Board, State
+from config import width
+
+def play_game(game_seed: int, time_control: float, random_moves: int) -> Tuple[List[int], List[int], List[List[int]], int]:
+    """Plays one game of `Algo` against itself.
+    The first `random_moves` moves are sampled by visit count, to diversify the games.
+    Returns the bitboards of the player to move and of the opponent at each position,
+    the visit counts of the root children per column, and the winner.
+    """
+    seed(game_seed)
+    rng = Random(game_seed)
+    algo = Algo()
+    board = Board()
+    own: List[int] = []
+    opp: List[int] = []
+    visits: List[List[int]] = []
+    while board.winner == State.UNDETERMINED:
+        move = algo.next_move(board, time_control)
+        counts = [0] * width
+        for child in algo.root.children:
+            if child.move != -1:
+                counts[child.move] = child.N
+        own.append(board.X_table if board.is_X_turn else board.O_table)
+        opp.append(board.O_table if board.is_X_turn else board.X_table)
+        visits.append(counts)
+        if board.move_count < random_moves:
+            children = algo.root.children
+            move = rng.choices([child.move for child in children], [child.N for child in children])[0]
+        board = board.move(move)
+    return own, opp, visits, board.winner
+
+def generate(games: int, time_control: float, random_moves: int, workers: int, start_seed: int=0) -> dict:
+    """Plays `games` self-play games on a process pool.
+    Returns the positions as arrays, the outcome being for the player to move,
+    with the index of the game of each position.
+    """
+    own: List[int] = []
+    opp: List[int] = []
+    visits: List[List[int]] = []
+    outcomes: List[int] = []
+    game_ids: List[int] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(play_game, start_seed + i, time_control, random_moves)
+            for i in range(games)
+        ]
+        for game_id, future in enumerate(futures):
+            game_own, game_opp, game_visits, winner = future.result()
+            own += game_own
+            opp += game_opp
+            visits += game_visits
+            game_ids += [game_id] * len(game_own)
+            # The last position is the one where the winner moved,
+            # so going backwards, the player to move alternates between winner and loser.
+            result = 0 if winner == State.DRAW else 1
+            for i in range(len(game_own)):
+                outcomes.append(result if (len(game_own) - i) % 2 == 1 else -result)
+    return {
+        "own": np.array(own, dtype=np.uint64),
+        "opp": np.array(opp, dtype=np.uint64),
+        "visits": np.minimum(np.array(visits), np.iinfo(np.uint16).max).astype(np.uint16),
+        "outcomes": np.array(outcomes, dtype=np.int8),
+        "games": np.array(game_ids, dtype=np.uint32),
+    }
+
+def main():
+    parser = ArgumentParser(description="Generate self-play games of the engine.")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--time-control", type=float, default=0.05)
+    parser.add_argument("--random-moves", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, default="selfplay.npz")
+    args = parser.parse_args()
+
+    data = generate(args.games, args.time_control, args.random_moves, args.workers, args.seed)
+    np.savez_compressed(args.output, **data)
+    print(f"Saved {len(data['outcomes'])} positions from {args.games} games to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+import unittest
+
+from .selfplay import generate
+
+class SelfplayTest(unittest.TestCase):
+    def test_outcomes(self):
+        for seed in range(5):
+            data = generate(1, 0.005, 0, 1, seed)
+            outcomes = data["outcomes"].tolist()
+            self.assertEqual(len(data["own"]), len(outcomes))
+            if outcomes[-1] == 0:
+                # Draw
+                self.assertEqual([0] * len(outcomes), outcomes)
+                continue
+            # The position before the winning move is labelled as won for the player to move
+            self.assertEqual(1, outcomes[-1])
+            for i in range(len(outcomes) - 1):
+                self.assertEqual(-outcomes[i + 1], outcomes[i])
+            return
+        self.fail("No decisive game")
@@ -0,0 +1,129 @@
+from argparse import ArgumentParser
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from algo import Evaluator
+from config import height, width
+from .model import Model
+
+def load(paths: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Loads self-play files into features, value targets, policy targets,
+    and the game of each position, unique across files.
+    """
+    features: List[np.ndarray] = []
+    values: List[np.ndarray] = []
+    policies: List[np.ndarray] = []
+    games: List[np.ndarray] = []
+    game_count = 0
+    for path in paths:
+        file = np.load(path)
+        visits = file["visits"].astype(np.float32)
+        features.append(Evaluator.features(file["own"], file["opp"]))
+        values.append(file["outcomes"].astype(np.float32))
+        policies.append(visits / np.maximum(visits.sum(axis=1, keepdims=True), 1))
+        # Files without game indices are split by position instead
+        file_games = file["games"].astype(np.int64) if "games" in file else np.arange(len(visits))
+        games.append(file_games + game_count)
+        game_count += int(file_games.max()) + 1 if len(file_games) > 0 else 0
+    return (
+        np.concatenate(features),
+        np.concatenate(values),
+        np.concatenate(policies),
+        np.concatenate(games),
+    )
+
+def mirror(features: np.ndarray, policies: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the features and policies of the mirror images of the positions.
+    """
+    mirrored = features.reshape(-1, 2, height, width)[:, :, :, ::-1].reshape(len(features), -1)
+    return mirrored, policies[:, ::-1]
+
+def split(features: np.ndarray, values: np.ndarray, policies: np.ndarray, games: np.ndarray,
+          validation: float, rng: np.random.Generator
+          ) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Splits the positions into a training and a validation set by game.
+    Only the training set is augmented with mirror images, as the board is symmetric,
+    and validation positions also found in the training set, mirrored or not, are dropped.
+    """
+    unique_games = rng.permutation(np.unique(games))
+    val_games = unique_games[:int(len(unique_games) * validation)]
+    is_val = np.isin(games, val_games)
+
+    train_features, train_policies = features[~is_val], policies[~is_val]
+    mirrored_features, mirrored_policies = mirror(train_features, train_policies)
+    train_features = np.concatenate((train_features, mirrored_features))
+    train_set = (
+        train_features,
+        np.concatenate((values[~is_val], values[~is_val])),
+        np.concatenate((train_policies, mirrored_policies)),
+    )
+
+    seen = {row.tobytes() for row in train_features}
+    val_idx = np.flatnonzero(is_val)
+    val_idx = val_idx[np.array([features[i].tobytes() not in seen for i in val_idx], dtype=bool)]
+    val_set = (features[val_idx], values[val_idx], policies[val_idx])
+    return train_set, val_set
+
+def train(train_set: Tuple[np.ndarray, np.ndarray, np.ndarray],
+          val_set: Tuple[np.ndarray, np.ndarray, np.ndarray],
+          hidden: int, epochs: int, batch_size: int, lr: float, weight_decay: float,
+          rng: np.random.Generator) -> Model:
+    features, values, policies = train_set
+    train_idx = np.arange(len(features))
+    model = Model(hidden, rng)
+    for epoch in range(epochs):
+        rng.shuffle(train_idx)
+        for start in range(0, len(train_idx), batch_size):
+            batch = train_idx[start:start + batch_size]
+            _, _, grads = model.loss_and_grads(features[batch], values[batch], policies[batch])
+            model.adam_step(grads, lr, weight_decay)
+        if len(val_set[0]) > 0:
+            value_loss, policy_loss, _ = model.loss_and_grads(*val_set)
+            print(f"Epoch {epoch + 1}: validation value loss {value_loss:.4f}, policy loss {policy_loss:.4f}")
+    return model
+
+def export(weights: Dict[str, object], path: str, line_length: int=96) -> None:
+    """Writes the weights as a python literal, so that they can be embedded in `combined.py`.
+    """
+    lines = [
+        "# Weights of the leaf evaluator, written by `python -m train.train`.",
+        "WEIGHTS = {",
+    ]
+    for key, value in weights.items():
+        if isinstance(value, tuple):
+            shape, data = value
+            lines.append(f"    \"{key}\": ({shape}, (")
+            for start in range(0, len(data), line_length):
+                lines.append(f"        \"{data[start:start + line_length]}\"")
+            lines.append("    )),")
+        else:
+            lines.append(f"    \"{key}\": {value},")
+    lines.append("}")
+    with open(path, "w") as file:
+        file.write("\n".join(lines) + "\n")
+
+def main():
+    parser = ArgumentParser(description="Train the leaf evaluator on self-play games.")
+    parser.add_argument("data", nargs="+", help="Files written by train.selfplay")
+    parser.add_argument("--hidden", type=int, default=64)
+    parser.add_argument("--epochs", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--lr", type=float, default=1e-3)
+    parser.add_argument("--weight-decay", type=float, default=1e-4)
+    parser.add_argument("--validation", type=float, default=0.1, help="Fraction of games held out")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, default="algo/weights.py")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    train_set, val_set = split(*load(args.data), args.validation, rng)
+    print(f"Training on {len(train_set[0])} positions, including mirror images, "
+          f"validating on {len(val_set[0])} unseen positions")
+    model = train(train_set, val_set, args.hidden, args.epochs, args.batch_size,
+                  args.lr, args.weight_decay, rng)
+    export(model.to_weights(), args.output)
+    print(f"Exported weights to {args.output}")
+
+if __name__ == '__main__':
+    main()
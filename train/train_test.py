@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from algo import Evaluator
+from board import Board
+from config import width
+from .train import load, mirror, split
+
+class TrainTest(unittest.TestCase):
+    def _save(self, directory: str, boards, games) -> str:
+        own, opp = Evaluator.bitboards(boards)
+        visits = np.tile(np.arange(1, width + 1, dtype=np.uint16), (len(boards), 1))
+        path = os.path.join(directory, "selfplay.npz")
+        np.savez(path, own=own, opp=opp, visits=visits,
+                 outcomes=np.ones(len(boards), dtype=np.int8), games=np.array(games, dtype=np.uint32))
+        return path
+
+    def test_mirror(self):
+        moves = [0, 1, 1, 3, 2, 2, 6]
+        board = Board()
+        mirrored = Board()
+        for move in moves:
+            board = board.move(move)
+            mirrored = mirrored.move(width - 1 - move)
+
+        with tempfile.TemporaryDirectory() as directory:
+            features, values, policies, games = load([self._save(directory, [board], [0])])
+        mirrored_features, mirrored_policies = mirror(features, policies)
+
+        visits = np.arange(1, width + 1)
+        np.testing.assert_array_equal(Evaluator.features(*Evaluator.bitboards([board])), features)
+        np.testing.assert_array_equal(Evaluator.features(*Evaluator.bitboards([mirrored])), mirrored_features)
+        np.testing.assert_array_equal([1], values)
+        np.testing.assert_array_equal([0], games)
+        np.testing.assert_allclose([visits / visits.sum()], policies)
+        np.testing.assert_allclose([visits[::-1] / visits.sum()], mirrored_policies)
+
+    def test_split(self):
+        # Each game starts from the empty board, and game 1 is the mirror of game 0
+        games_moves = [[0, 1, 2], [6, 5, 4], [3, 3, 2], [1, 4, 4], [2, 6, 0], [5, 0, 3]]
+        boards = []
+        games = []
+        for game, moves in enumerate(games_moves):
+            board = Board()
+            for move in moves:
+                boards.append(board)
+                games.append(game)
+                board = board.move(move)
+
+        with tempfile.TemporaryDirectory() as directory:
+            features, values, policies, games = load([self._save(directory, boards, games)])
+        train_set, val_set = split(features, values, policies, games, 0.5, np.random.default_rng(0))
+
+        self.assertGreater(len(val_set[0]), 0)
+        self.assertEqual(len(train_set[0]), len(train_set[1]))
+        self.assertEqual(len(train_set[0]), len(train_set[2]))
+        train_rows = {row.tobytes() for row in train_set[0]}
+        mirrored_val, _ = mirror(val_set[0], val_set[2])
+        for row, mirrored_row in zip(val_set[0], mirrored_val):
+            self.assertNotIn(row.tobytes(), train_rows)
+            self.assertNotIn(mirrored_row.tobytes(), train_rows)